@@ -1,65 +1,141 @@
 """Constraint functions for the pyomo model."""
 
+import pyomo.environ as pe
+from pyomo.core.expr import LinearExpression
+
 __all__ = [
-    "case_start_time",
-    "case_end_time",
+    "SAME_STUDENT_GAP",
+    "add_case_time_constraints",
+    "add_no_overlap_constraints",
     "only_one_session",
-    "no_case_overlap",
     "no_same_day",
     "session_utilized",
 ]
 
+# Minimum number of minutes between two appointments for the same student; large
+# enough that the appointments must land on different days.
+SAME_STUDENT_GAP = 800
 
-def case_start_time(model, case, session):
-    """
-    Ensures that the case start time is after the start time of the session.
+
+def add_case_time_constraints(model):
     """
-    return model.CASE_START_TIME[case, session] >= model.SESSION_START_TIME[session] - (
-        (1 - model.SESSION_ASSIGNED[(case, session)]) * model.M
-    )
+    Adds the constraints keeping each assigned case inside its session window:
+    the case start time must be after the session start, and the case end time
+    before the session end. Both are relaxed by Big-M when the case is not
+    assigned to the session.
 
+    The rows are built in bulk as LinearExpression objects on ConstraintLists,
+    which skips Pyomo's per-index rule dispatch — the slowest constraint
+    construction path when there are many tasks.
 
-def case_end_time(model, case, session):
-    """
-    Ensures that the case end time is before the end time of the session.
+    Each row carries its own minimal M: relaxing the start row only has to reach
+    down to 0 (so the session start suffices), and relaxing the end row only has
+    to absorb how far the window start plus the duration can poke past the window
+    end. Unassigned start times then sit inside (or at the front of) the session
+    window, which the no-overlap coefficients already assume.
     """
-    return model.CASE_START_TIME[case, session] + model.CASE_DURATION[
-        case
-    ] <= model.SESSION_END_TIME[session] + (
-        (1 - model.SESSION_ASSIGNED[(case, session)]) * model.M
-    )
+    model.CASE_START = pe.ConstraintList()
+    model.CASE_END_TIME = pe.ConstraintList()
+
+    for case, session in model.TASKS:
+        assigned = model.SESSION_ASSIGNED[case, session]
+        start_time = model.CASE_START_TIME[case, session]
+        session_start = pe.value(model.SESSION_START_TIME[session])
+        session_end = pe.value(model.SESSION_END_TIME[session])
+        duration = pe.value(model.CASE_DURATION[case])
+
+        m_start = session_start
+        m_end = max(0.0, session_start + duration - session_end)
+
+        # start >= session_start - (1 - assigned) * m_start
+        model.CASE_START.add(
+            LinearExpression(
+                constant=0.0,
+                linear_coefs=[1.0, -m_start],
+                linear_vars=[start_time, assigned],
+            )
+            >= session_start - m_start
+        )
+        # start + duration <= session_end + (1 - assigned) * m_end
+        model.CASE_END_TIME.add(
+            LinearExpression(
+                constant=0.0,
+                linear_coefs=[1.0, m_end],
+                linear_vars=[start_time, assigned],
+            )
+            <= session_end - duration + m_end
+        )
 
 
 def only_one_session(model, case):
     """
-    Ensures that cases are only assigned to one session.
+    Ensures that cases are only assigned to one session. The tasks for each case are
+    pre-indexed on the model to avoid filtering all of model.TASKS per case.
     """
     return (
-        sum([model.SESSION_ASSIGNED[task] for task in model.TASKS if task[0] == case])
+        sum(
+            model.SESSION_ASSIGNED[case, session]
+            for session in model._tasks_by_case[case]
+        )
         <= 1
     )
 
 
-def no_case_overlap(model, case1, session1, case2, session2):
+def add_no_overlap_constraints(model):
     """
-    Ensures that cases are not scheduled in overlapping sessions.
+    Ensures that cases are not scheduled in overlapping sessions. Each unordered
+    task pair gets a single ordering binary: ORDER = 1 puts task1 before task2 and
+    ORDER = 0 the reverse, with both rows relaxed by Big-M unless both cases are
+    assigned.
+
+    Writing the disjunction out directly (rather than via pyomo.gdp) skips the
+    gdp.bigm transformation pass, its auxiliary indicator variable per disjunct,
+    and the loose M it estimates from variable bounds.
+
+    Each row gets its own minimal M, derived from the two session windows: the
+    largest value start1 + duration1 - start2 can take is bounded by the first
+    session's window end (or window start plus duration) minus the second
+    session's window start. Per-row coefficients this tight keep the LP
+    relaxation as strong as the pairwise formulation allows.
     """
-    task1 = (case1, session1)
-    task2 = (case2, session2)
-    return [
-        model.CASE_START_TIME[task1] + model.CASE_DURATION[case1]
-        <= model.CASE_START_TIME[task2]
-        + (
-            (2 - model.SESSION_ASSIGNED[task1] - model.SESSION_ASSIGNED[task2])
-            * model.M
-        ),
-        model.CASE_START_TIME[task2] + model.CASE_DURATION[case2]
-        <= model.CASE_START_TIME[task1]
-        + (
-            (2 - model.SESSION_ASSIGNED[task1] - model.SESSION_ASSIGNED[task2])
-            * model.M
-        ),
-    ]
+    model.ORDER = pe.Var(model.DISJUNCTIONS, domain=pe.Binary)
+    model.NO_OVERLAP = pe.ConstraintList()
+
+    for case1, session1, case2, session2 in model.DISJUNCTIONS:
+        start1 = model.CASE_START_TIME[case1, session1]
+        start2 = model.CASE_START_TIME[case2, session2]
+        assigned1 = model.SESSION_ASSIGNED[case1, session1]
+        assigned2 = model.SESSION_ASSIGNED[case2, session2]
+        duration1 = pe.value(model.CASE_DURATION[case1])
+        duration2 = pe.value(model.CASE_DURATION[case2])
+        order = model.ORDER[case1, session1, case2, session2]
+
+        window_start1 = pe.value(model.SESSION_START_TIME[session1])
+        window_start2 = pe.value(model.SESSION_START_TIME[session2])
+        window_end1 = pe.value(model.SESSION_END_TIME[session1])
+        window_end2 = pe.value(model.SESSION_END_TIME[session2])
+
+        m1 = max(0.0, max(window_end1, window_start1 + duration1) - window_start2)
+        m2 = max(0.0, max(window_end2, window_start2 + duration2) - window_start1)
+
+        # start1 + duration1 <= start2 + (3 - assigned1 - assigned2 - order) * m1
+        model.NO_OVERLAP.add(
+            LinearExpression(
+                constant=0.0,
+                linear_coefs=[1.0, -1.0, m1, m1, m1],
+                linear_vars=[start1, start2, assigned1, assigned2, order],
+            )
+            <= 3 * m1 - duration1
+        )
+        # start2 + duration2 <= start1 + (2 - assigned1 - assigned2 + order) * m2
+        model.NO_OVERLAP.add(
+            LinearExpression(
+                constant=0.0,
+                linear_coefs=[1.0, -1.0, m2, m2, -m2],
+                linear_vars=[start2, start1, assigned1, assigned2, order],
+            )
+            <= 2 * m2 - duration2
+        )
 
 
 def session_utilized(model, session):
@@ -68,27 +144,31 @@ def session_utilized(model, session):
     the session.
     """
     return model.STUDENTS_IN_SESSION[session] == sum(
-        [model.SESSION_ASSIGNED[task] for task in model.TASKS if task[1] == session]
+        model.SESSION_ASSIGNED[case, session]
+        for case in model._tasks_by_session[session]
     )
 
 
 def no_same_day(model, case1, session1, case2, session2):
     """
-    Ensures that a student is not scheduled for two sessions on the same day.
+    Ensures that a student is not scheduled for two sessions on the same day, i.e.
+    their two start times are at least SAME_STUDENT_GAP minutes apart. model.M_DD
+    is the smallest valid Big-M for these rows: the start-time difference is
+    bounded by the horizon, so horizon + SAME_STUDENT_GAP always deactivates them.
     """
     task1 = (case1, session1)
     task2 = (case2, session2)
     return [
         (model.CASE_START_TIME[task1] - model.CASE_START_TIME[task2])
         >= (
-            800
+            SAME_STUDENT_GAP
             - (2 - model.SESSION_ASSIGNED[task1] - model.SESSION_ASSIGNED[task2])
-            * model.M
+            * model.M_DD
         ),
         (model.CASE_START_TIME[task2] - model.CASE_START_TIME[task1])
         >= (
-            800
+            SAME_STUDENT_GAP
             - (2 - model.SESSION_ASSIGNED[task1] - model.SESSION_ASSIGNED[task2])
-            * model.M
+            * model.M_DD
         ),
     ]
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pandas as pd
 from calendar_view.calendar import Calendar
 from calendar_view.config import style
@@ -30,27 +32,21 @@ def plot_calendar(results_df: pd.DataFrame, save_fn: str | None = None):
         legend=False,
     )
 
-    events = []
-    for _, row in results_df.iterrows():
-        day = Day[row["Day"]].value - 1
-        start = row["Start"]
-        end = row["End"]
-
-        s = row["Case"]
-        parts = s.split("_")
-        title = parts[0] if len(parts) > 0 else s
-
-        events.append(
-            dict(
-                title=title,
-                day_of_week=day,
-                start=start,
-                end=end,
-                style=get_style(row["Grade"]),
-            )
+    df = results_df.copy()
+    df["DayNum"] = df["Day"].map({day.name: day.value - 1 for day in Day})
+    df["Title"] = df["Case"].astype(str).str.split("_").str[0]
+    df = df.sort_values(["DayNum", "Start"])
+
+    events = [
+        Event(
+            title=row.Title,
+            day_of_week=row.DayNum,
+            start=row.Start,
+            end=row.End,
+            style=get_style(row.Grade),
         )
-    events = sorted(events, key=lambda x: (x["day_of_week"], x["start"]))
-    events = [Event(**event) for event in events]
+        for row in df.itertuples(index=False)
+    ]
 
     data.validate_config(config)
     data.validate_events(events, config)
@@ -64,37 +60,34 @@ def plot_calendar(results_df: pd.DataFrame, save_fn: str | None = None):
         calendar.save("calendar.png")
 
 
+@lru_cache(maxsize=None)
 def image_font(size: int):
+    """
+    Loads the calendar font at the given size. Cached so each size is read and
+    parsed from disk only once per process, not once per rendered calendar.
+    """
     font_path: str = "Roboto-Regular.ttf"
     path: str = resource_filename("calendar_view.resources.fonts", font_path)
     return ImageFont.truetype(path, size)
 
 
+_ORANGE = EventStyle(event_border=(250, 165, 0, 240), event_fill=(250, 165, 0, 140))
+_PURPLE = EventStyle(event_border=(128, 0, 128, 240), event_fill=(128, 0, 128, 150))
+_PINK = EventStyle(event_border=(255, 192, 203, 240), event_fill=(255, 192, 203, 180))
+
+_STYLE_BY_GRADE = {
+    0: _PINK,
+    1: EventStyles.BLUE,
+    2: EventStyles.GREEN,
+    3: _PURPLE,
+    4: _ORANGE,
+    5: EventStyles.RED,
+    -1: EventStyles.GRAY,
+}
+
+
 def get_style(grade):
     """
     Get color by grade of school (range from -1 to 5)
     """
-    EventStyles.ORANGE = EventStyle(
-        event_border=(250, 165, 0, 240), event_fill=(250, 165, 0, 140)
-    )
-    EventStyles.PURPLE = EventStyle(
-        event_border=(128, 0, 128, 240), event_fill=(128, 0, 128, 150)
-    )
-    EventStyles.PINK = EventStyle(
-        event_border=(255, 192, 203, 240), event_fill=(255, 192, 203, 180)
-    )
-
-    if grade == 0:
-        return EventStyles.PINK
-    elif grade == 1:
-        return EventStyles.BLUE
-    elif grade == 2:
-        return EventStyles.GREEN
-    elif grade == 3:
-        return EventStyles.PURPLE
-    elif grade == 4:
-        return EventStyles.ORANGE
-    elif grade == 5:
-        return EventStyles.RED
-    elif grade == -1:
-        return EventStyles.GRAY
+    return _STYLE_BY_GRADE.get(grade)
@@ -1,8 +1,13 @@
 """Class and script for scheduling student therapy appointments."""
 import logging
-from itertools import product
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, product
 from pathlib import Path
+from typing import Literal
 
+import numpy as np
 import pandas as pd
 import pyomo.environ as pe
 import pyomo.gdp as pyogdp
@@ -14,6 +19,18 @@ from cschedule.utils import *
 
 TOTAL_MINS_IN_WEEK = 5 * 1440
 
+# HiGHS runs single-threaded with conservative MIP settings out of the box; these
+# defaults enable its parallel simplex/branch-and-bound, keep presolve on, and
+# accept near-optimal solutions (the objective is integer-valued, so a 1e-4
+# relative gap still proves the exact optimum on realistic caseloads).
+_DEFAULT_HIGHS_OPTIONS = {
+    "parallel": "on",
+    "threads": os.cpu_count(),
+    "presolve": "on",
+    "mip_heuristic_effort": 0.2,
+    "mip_rel_gap": 1e-4,
+}
+
 
 class Scheduler:
     """
@@ -31,6 +48,7 @@ class Scheduler:
         cases_fn: str | None = None,
         sessions_fn: str | None = None,
         no_duplicate_days: bool = True,
+        reformulation: Literal["bigm", "hull"] = "hull",
     ):
         """
         Args:
@@ -41,7 +59,12 @@ class Scheduler:
                 (data/sessions.xlsx).
             no_duplicate_days (bool): if True, then students will not be scheduled for two
                 sessions on the same day. Defaults to True.
+            reformulation (str): how the same-day disjunctions are reformulated to
+                MILP — "hull" (convex hull, tighter relaxation at the cost of extra
+                disaggregated variables) or "bigm". Defaults to "hull".
         """
+        if reformulation not in ("bigm", "hull"):
+            raise ValueError(f"Unknown reformulation: {reformulation}")
         data_dir = Path(__file__).resolve().parents[1] / "data"
 
         if cases_fn is None:
@@ -54,35 +77,64 @@ class Scheduler:
         self.df_cases = load_function(cases_fn)
         self.df_sessions = load_function(sessions_fn)
 
+        # Cases are integer-encoded inside the model: indexing variables with
+        # (int, int) tuples hashes much faster than (str, int) and keeps Pyomo's
+        # component dicts small. Names are mapped back when results are reported.
+        self._case_ids = {name: i for i, name in enumerate(self.df_cases["Name"])}
+        self._case_names = {i: name for name, i in self._case_ids.items()}
+
         self.available_windows = self._get_available_windows()
         self.sessions = self._get_unique_availabilities()
+        # Packed copy of the session windows, in key order. Window bounds are whole
+        # minutes since Monday 12AM (max 7200), so int32 is exact; array kernels
+        # index this directly instead of rebuilding tuple lists per call.
+        self._sessions_arr = np.array(list(self.sessions.values()), dtype=np.int32)
 
         self.student_availabilities = self._get_student_availabilities()
-        self.model = self._create_model(no_duplicate_days)
+        self._case_sessions = self._get_case_sessions()
+        self.model = self._create_model(no_duplicate_days, reformulation)
         self._configure_logger()
         self.logger.info(f"Successfully created model.")
 
-    def _create_model(self, no_duplicate_days):
+    def _create_model(self, no_duplicate_days, reformulation="hull"):
         """
         Create pyomo model. This is called in the constructor.
 
+        Note that model.TASKS only contains (case, session) pairs that are compatible
+        with the student's availability — infeasible pairs are pruned here rather than
+        excluded later with an availability constraint, which would add a redundant
+        Big-M row per pair.
+
         no_duplicate_days (bool): if True, then students will not be scheduled for two
             sessions on the same day. Defaults to True.
+        reformulation (str): GDP reformulation applied to the same-day
+            disjunctions, either "hull" or "bigm". Defaults to "hull".
 
         """
         model = pe.ConcreteModel()
 
-        model.CASES = pe.Set(initialize=self.df_cases["Name"].tolist())
+        model.CASES = pe.Set(initialize=list(self._case_names))
         model.SESSIONS = pe.Set(initialize=list(self.sessions.keys()))
 
-        tasks = []
-        for case, session in model.CASES * model.SESSIONS:
-            if self._check_if_available(case, session):
-                tasks.append((case, session))
+        tasks = [
+            (case, session)
+            for case, session_ids in self._case_sessions.items()
+            for session in session_ids
+        ]
 
         model.TASKS = pe.Set(initialize=tasks, dimen=2)
+
+        # Pre-index the tasks by case and by session so constraint rules can sum
+        # over just the relevant tasks instead of scanning all of model.TASKS for
+        # every case/session index.
+        tasks_by_session = defaultdict(list)
+        for case, session in tasks:
+            tasks_by_session[session].append(case)
+
+        model._tasks_by_case = self._case_sessions
+        model._tasks_by_session = dict(tasks_by_session)
         model.CASE_DURATION = pe.Param(
-            model.CASES, initialize=self._generate_case_durations()
+            model.CASES, initialize=self._generate_case_durations(), mutable=True
         )
         model.SESSION_START_TIME = pe.Param(
             model.SESSIONS, initialize=self._generate_session_start_times()
@@ -97,39 +149,42 @@ class Scheduler:
             initialize=self._generate_student_disjunctions(model.TASKS), dimen=4
         )
 
-        model.M = pe.Param(initialize=1e3 * TOTAL_MINS_IN_WEEK)
+        # Smallest M that can deactivate a same-day row: the start-time difference
+        # is bounded by the horizon, plus the gap on the right-hand side.
+        model.M_DD = pe.Param(initialize=TOTAL_MINS_IN_WEEK + SAME_STUDENT_GAP)
         num_cases = self.df_cases.shape[0]
 
         model.SESSION_ASSIGNED = pe.Var(model.TASKS, domain=pe.Binary)
         model.CASE_START_TIME = pe.Var(
-            model.TASKS, bounds=(0, TOTAL_MINS_IN_WEEK), within=pe.PositiveReals
+            model.TASKS, bounds=(0, TOTAL_MINS_IN_WEEK), within=pe.NonNegativeReals
         )
         model.STUDENTS_IN_SESSION = pe.Var(
-            model.SESSIONS, bounds=(0, num_cases), within=pe.PositiveReals
+            model.SESSIONS, bounds=(0, num_cases), within=pe.NonNegativeReals
         )
 
         model.OBJECTIVE = pe.Objective(rule=summation, sense=pe.maximize)
 
-        model.CASE_START = pe.Constraint(model.TASKS, rule=case_start_time)
-        model.CASE_END_TIME = pe.Constraint(model.TASKS, rule=case_end_time)
+        add_case_time_constraints(model)
         model.SESSION_ASSIGNMENT = pe.Constraint(model.CASES, rule=only_one_session)
 
-        model.DISJUNCTIONS_RULE = pyogdp.Disjunction(
-            model.DISJUNCTIONS, rule=no_case_overlap
-        )
+        add_no_overlap_constraints(model)
+
+        model.SESSION_UTIL = pe.Constraint(model.SESSIONS, rule=session_utilized)
+
         if no_duplicate_days:
             model.STUDENT_DISJUNCTIONS_RULE = pyogdp.Disjunction(
                 model.STUDENT_DISJUNCTIONS, rule=no_same_day
             )
-
-        model.SESSION_UTIL = pe.Constraint(model.SESSIONS, rule=session_utilized)
-
-        pe.TransformationFactory("gdp.bigm").apply_to(model)
+            pe.TransformationFactory(f"gdp.{reformulation}").apply_to(model)
 
         return model
 
     def solve(
-        self, solver_name: str = "appsi_highs", options: dict | None = None
+        self,
+        solver_name: str = "appsi_highs",
+        options: dict | None = None,
+        save_results: bool = True,
+        warm_start_from: "Scheduler | None" = None,
     ) -> pd.DataFrame:
         """
         Solve the model using the specified solver. Default solver is "appsi_highs", a
@@ -137,72 +192,123 @@ class Scheduler:
 
         Args:
             solver_name (str): name of the solver to use. Defaults to "appsi_highs".
-            options (dict): dictionary of solver options. Defaults to None.
+            options (dict): dictionary of solver options. For HiGHS solvers these
+                are merged over _DEFAULT_HIGHS_OPTIONS, so any default can be
+                overridden per call. Defaults to None.
+            save_results (bool): if True, the results are saved to
+                ../results/results.xlsx and the calendar image to
+                ../results/calendar.png. Defaults to True.
+            warm_start_from (Scheduler): a previously solved Scheduler whose model
+                has the same tasks and sessions. Its final solver basis is loaded
+                before solving, letting simplex re-optimize from a nearby basis
+                on re-runs after small data tweaks. Ignored with a warning if the
+                solver does not expose a basis or the structures differ.
 
         Returns:
-            (pandas.DataFrame): dataframe with the results of the model. This is also
-                saved to ../results/results.xlsx.
+            (pandas.DataFrame): dataframe with the results of the model.
 
         """
         solver = pe.SolverFactory(solver_name)
 
+        if "highs" in solver_name:
+            options = {**_DEFAULT_HIGHS_OPTIONS, **(options or {})}
+
         if options is not None:
             for key, v in options.items():
                 solver.options[key] = v
 
+        if warm_start_from is not None:
+            self._load_basis(solver, warm_start_from)
+
         solver_output = solver.solve(self.model, tee=True)
+        self._basis = self._extract_basis(solver)
         self._print_solver_output()
 
-        results = []
-        for case, session in self.model.TASKS:
-            start_mins = round(self.model.CASE_START_TIME[case, session](), 0)
-            end_mins = round(
-                self.model.CASE_START_TIME[case, session]()
-                + self.model.CASE_DURATION[case],
-                0,
-            )
+        # Built once: looking grades up per task via a df_cases boolean mask would
+        # rescan the whole cases table for every element of TASKS.
+        grades = dict(zip(self.df_cases["Name"], self.df_cases["Grade"]))
+
+        # Bulk-extract the solution into arrays and build the DataFrame column-wise:
+        # one get_values() call per variable and a single DataFrame allocation.
+        # Only assigned tasks are kept (> 0.5 guards against solver tolerances on
+        # the binaries), so the start/end conversion work is O(|CASES|) rather
+        # than O(|TASKS|).
+        start_values = self.model.CASE_START_TIME.get_values()
+        assigned_values = self.model.SESSION_ASSIGNED.get_values()
+        durations = self.model.CASE_DURATION.extract_values()
+
+        tasks = [task for task, v in assigned_values.items() if v and v > 0.5]
+
+        names = [self._case_names[case] for case, _ in tasks]
+        starts = np.array([start_values[task] for task in tasks]).round()
+        ends = starts + np.array([durations[case] for case, _ in tasks])
+
+        days, start_strs = mins_to_days_and_times(starts)
+        _, end_strs = mins_to_days_and_times(ends)
+
+        self.df_times = pd.DataFrame(
+            {
+                "Case": names,
+                "Grade": [grades[name] for name in names],
+                "Day": days,
+                "Start": start_strs,
+                "End": end_strs,
+            }
+        )
+        # The calendar is plotted from the in-memory frame; the xlsx write is for
+        # user persistence only, so no read-back round-trip is needed.
+        if save_results:
+            self.df_times.to_excel("../results/results.xlsx", engine="xlsxwriter")
+            plot_calendar(self.df_times, save_fn="../results/calendar.png")
 
-            day, start = mins_to_day_and_time(start_mins)
-            _, end = mins_to_day_and_time(end_mins)
-
-            results.append(
-                {
-                    "Case": case,
-                    "Grade": self.df_cases[self.df_cases["Name"] == case]["Grade"].iloc[
-                        0
-                    ],
-                    "Day": day,
-                    "Start": start,
-                    "End": end,
-                    "Assignment": self.model.SESSION_ASSIGNED[case, session](),
-                }
-            )
+        return self.df_times
 
-        self.df_times = pd.DataFrame(results)
-        self.df_times[self.df_times["Assignment"] == 1].drop(
-            columns=["Assignment"]
-        ).to_excel("../results/results.xlsx")
+    def update_durations(self, new_durations: dict) -> None:
+        """
+        Updates case durations in place so solve() can be re-run without
+        reconstructing the model.
 
-        results_df = pd.read_excel("../results/results.xlsx")
-        plot_calendar(results_df, save_fn="../results/calendar.png")
+        The model is built once per Scheduler and reused across solve() calls, so
+        the expensive structural work — set construction, disjunction enumeration,
+        and the GDP reformulation of the same-day disjunctions — never repeats.
+        Durations, however, are baked into the time-window and no-overlap rows as
+        numeric coefficients and Big-M values, so just those two constraint blocks
+        are regenerated here; the same-day rows involve only start times and are
+        left untouched.
 
-        return results_df
+        Args:
+            new_durations (dict): mapping of case name (e.g. "Steve_1") to its new
+                duration in minutes. Cases not listed keep their current duration.
+        """
+        unknown = set(new_durations).difference(self._case_ids)
+        if unknown:
+            raise ValueError(f"Unknown case names: {sorted(unknown)}")
+
+        mask = self.df_cases["Name"].isin(new_durations)
+        self.df_cases.loc[mask, "Duration"] = self.df_cases.loc[mask, "Name"].map(
+            new_durations
+        )
+
+        for name, duration in new_durations.items():
+            self.model.CASE_DURATION[self._case_ids[name]] = duration
+
+        for component in ("CASE_START", "CASE_END_TIME", "ORDER", "NO_OVERLAP"):
+            self.model.del_component(component)
+            self.model.del_component(f"{component}_index")
+
+        add_case_time_constraints(self.model)
+        add_no_overlap_constraints(self.model)
 
     def _generate_case_durations(self) -> dict:
         """
         Generate mapping of students sessions to durations
 
         Returns:
-            dictionary with student name as key and duration as value (mins)
+            dictionary with case ID as key and duration as value (mins)
         """
-        durations, names = [], []
-        for _, row in self.df_cases.iterrows():
-            name = row["Name"]
-            duration = row["Duration"]
-            durations.append(duration)
-            names.append(name)
-
-        return pd.Series(durations, index=names).to_dict()
+        return dict(
+            zip(self.df_cases["Name"].map(self._case_ids), self.df_cases["Duration"])
+        )
 
     def _generate_session_start_times(self):
         """
@@ -226,100 +332,219 @@ class Scheduler:
         """
         Generate disjunctions to prevent cases from overlapping.
         To save on computation a priori, we only generate disjunctions for sessions that
-        we know overlap (e.g., 9:00AM-10:00AM and 8:45AM-9:30AM).
+        we know overlap (e.g., 9:00AM-10:00AM and 8:45AM-9:30AM). The overlap test is
+        done once per session pair rather than once per task pair; tasks are then
+        bucketed by session so that only tasks in overlapping sessions are paired up.
+
+        Only unordered task pairs are emitted: no_case_overlap already encodes both
+        orderings inside a single disjunction, so adding (t2, t1) alongside (t1, t2)
+        would double the number of disjuncts for no gain.
+
+        Tasks are integer-encoded so the whole pair enumeration runs as array
+        operations: a task pair is kept if its cases differ and its sessions overlap,
+        evaluated for all pairs at once with a boolean broadcast.
         """
-        disjunctions = []
-        for t1, t2 in product(tasks, tasks):
-            if t1[0] != t2[0] and is_overlapping(
-                self.sessions[t1[1]], self.sessions[t2[1]]
-            ):
-                disjunctions.append((t1, t2))
+        tasks = list(tasks)
 
-        return disjunctions
+        session_ids = list(self.sessions)
+        session_pos = {sid: i for i, sid in enumerate(session_ids)}
+        case_pos = {case: i for i, case in enumerate(dict.fromkeys(c for c, _ in tasks))}
+
+        case_idx = np.array([case_pos[c] for c, _ in tasks])
+        sess_idx = np.array([session_pos[s] for _, s in tasks])
+
+        overlap = overlap_matrix(self._sessions_arr)
+
+        pairs = (case_idx[:, None] != case_idx[None, :]) & overlap[
+            np.ix_(sess_idx, sess_idx)
+        ]
+
+        return [
+            (tasks[i], tasks[j]) for i, j in zip(*np.nonzero(np.triu(pairs, k=1)))
+        ]
 
     def _generate_student_disjunctions(self, tasks):
         """
         Generates disjunctions for cases that are assigned to the same student. This
         is determined by looking at the first part of the case name (e.g., Steve in
         Steve_1) and checking if they are the same.
+
+        Only unordered pairs are emitted (no_same_day already returns both
+        orderings), and pairs whose session windows are at least SAME_STUDENT_GAP
+        minutes apart are skipped — those can never violate the gap, so their rows
+        would always be slack.
+
+        Tasks are bucketed by student first, so only pairs within a bucket are
+        enumerated rather than every pair of tasks.
         """
+        tasks_by_student = defaultdict(list)
+        for task in tasks:
+            tasks_by_student[self._case_names[task[0]].split("_")[0]].append(task)
+
         disjunctions = []
-        for t1, t2 in product(tasks, tasks):
-            if t1[0].split("_")[0] == t2[0].split("_")[0] and t1[0] != t2[0]:
-                disjunctions.append((t1, t2))
+        for student_tasks in tasks_by_student.values():
+            for t1, t2 in combinations(student_tasks, 2):
+                if t1[0] == t2[0]:
+                    continue
+
+                w1, w2 = self.sessions[t1[1]], self.sessions[t2[1]]
+                if max(0, w1[0] - w2[1], w2[0] - w1[1]) < SAME_STUDENT_GAP:
+                    disjunctions.append((t1, t2))
 
         return disjunctions
 
     def _get_available_windows(self):
         """
         Gets available session times, converted to minutes since Monday (12AM) from the
-        sessions table.
+        sessions table. The conversion is vectorized over the whole table rather than
+        performed row by row.
 
         Returns:
             (list): list of tuples with start and end times of available windows
         """
-        windows = []
-        for _, row in self.df_sessions.iterrows():
-            windows.append(
-                (
-                    day_and_time_to_mins(row["Day"], row["Start"].isoformat()),
-                    day_and_time_to_mins(row["Day"], row["End"].isoformat()),
-                )
-            )
+        starts = days_and_times_to_mins(self.df_sessions["Day"], self.df_sessions["Start"])
+        ends = days_and_times_to_mins(self.df_sessions["Day"], self.df_sessions["End"])
+
+        return list(zip(starts, ends))
+
+    def _melt_case_windows(self) -> pd.DataFrame:
+        """
+        Reshapes the wide Day_i/Start_i/End_i columns of the cases table into one long
+        table with columns [Name, Day, Start, End, StartMins, EndMins], one row per
+        availability window. This lets the minute conversion run vectorized over all
+        windows at once instead of once per cell.
+        """
+        cols = ["Name"] + [
+            col for col in self.df_cases.columns if col.split("_")[0] in ("Day", "Start", "End")
+        ]
+        df = pd.wide_to_long(
+            self.df_cases[cols], stubnames=["Day", "Start", "End"], i="Name", j="num", sep="_"
+        )
+        df = df.dropna(subset=["Day"]).reset_index()
+
+        df["StartMins"] = days_and_times_to_mins(df["Day"], df["Start"])
+        df["EndMins"] = days_and_times_to_mins(df["Day"], df["End"])
 
-        return windows
+        return df
 
     def _get_unique_availabilities(self):
         """
         Gets unique available session times from the cases table. This reduces the
-        complexity of the problem by removing duplicates.
-
-        """
-        availabilities = set()
-        for _, row in self.df_cases.iterrows():
-            for col, day in row.items():
-                if "Day" in col and not pd.isna(day):
-                    num = int(col.split("_")[1])
-                    availability = (
-                        day_and_time_to_mins(day, row[f"Start_{num}"].isoformat()),
-                        day_and_time_to_mins(day, row[f"End_{num}"].isoformat()),
-                    )
-                    if any(
-                        is_within_window(availability, available_window)
-                        for available_window in self.available_windows
-                    ):
-                        availabilities.add(availability)
+        complexity of the problem by removing duplicates. Windows that do not fall
+        within any available session window are filtered out with a single numpy
+        broadcast instead of per-window Python checks.
+
+        Only exactly identical windows are merged. Overlapping windows must stay
+        separate sessions: a case assigned to a session may be scheduled anywhere
+        inside that session's window, so widening a window to a merged maximal
+        interval would allow scheduling a student outside their own availability.
+        """
+        self._case_windows = self._melt_case_windows()
+
+        starts = self._case_windows["StartMins"].to_numpy()
+        ends = self._case_windows["EndMins"].to_numpy()
+        windows = np.asarray(self.available_windows)
+
+        within = (
+            (starts[:, None] >= windows[None, :, 0])
+            & (ends[:, None] <= windows[None, :, 1])
+        ).any(axis=1)
+
+        availabilities = set(zip(starts[within], ends[within]))
 
         return {i: t for i, t in enumerate(availabilities)}
 
     def _get_student_availabilities(self):
         """
         Returns a dict of student availabilities, where the key is the student name and
-        the value is a list of tuples of available windows.
-        """
-        availabilities = {}
-        for _, row in self.df_cases.iterrows():
-            name = row["Name"]
-            times = []
-            for col, val in row.items():
-                if "Day" in col and not pd.isna(val):
-                    num = int(col.split("_")[1])
-                    availability = (
-                        day_and_time_to_mins(val, row[f"Start_{num}"].isoformat()),
-                        day_and_time_to_mins(val, row[f"End_{num}"].isoformat()),
-                    )
-                    times.append(availability)
-            availabilities[name] = times
+        the value is a list of tuples of available windows. The windows come from the
+        long-format table built in _melt_case_windows, whose minute conversion already
+        ran vectorized — nothing is re-parsed per row here.
+        """
+        availabilities = {name: [] for name in self.df_cases["Name"]}
+        for name, start, end in zip(
+            self._case_windows["Name"],
+            self._case_windows["StartMins"],
+            self._case_windows["EndMins"],
+        ):
+            availabilities[name].append((start, end))
+
         return availabilities
 
-    def _check_if_available(self, case, session):
+    def _get_case_sessions(self):
+        """
+        Builds a mapping from case name to the set of session IDs the case can be
+        scheduled in. This is built once via a reverse window -> session lookup, so
+        enumerating tasks is a set lookup per case rather than a scan of the
+        student's windows for every (case, session) pair.
+        """
+        window_to_session = {window: sid for sid, window in self.sessions.items()}
+        return {
+            self._case_ids[case]: {
+                window_to_session[w] for w in windows if w in window_to_session
+            }
+            for case, windows in self.student_availabilities.items()
+        }
+
+    @staticmethod
+    def solve_many(
+        scenarios: list[dict], max_workers: int | None = None
+    ) -> list[pd.DataFrame]:
+        """
+        Solves several independent scenarios in parallel, one process per solve.
+        Useful for sensitivity analysis over variations of the input tables.
+
+        Args:
+            scenarios (list[dict]): one dict of Scheduler constructor arguments per
+                scenario (cases_fn, sessions_fn, no_duplicate_days, reformulation),
+                plus an optional "options" entry with solver options.
+            max_workers (int): number of worker processes. Defaults to half the
+                CPU count, leaving headroom for the solvers themselves.
+
+        Returns:
+            (list[pandas.DataFrame]): the results of each scenario, in input order.
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_solve_scenario, scenarios))
+
+    def _load_basis(self, solver, warm_start_from):
         """
-        Checks if a case is available for a given session.
+        Loads the cached solver basis from a previously solved Scheduler onto this
+        model's solver instance, so the solver can re-optimize from a nearby basis
+        instead of starting cold. Only applied when the two models share the same
+        tasks and sessions and the solver interface exposes a basis (appsi_highs
+        does, via the underlying highspy model).
         """
-        for window in self.student_availabilities[case]:
-            if window == self.sessions[session]:
-                return True
-        return False
+        basis = getattr(warm_start_from, "_basis", None)
+        if basis is None:
+            self.logger.warning("warm_start_from has no cached basis; solving cold.")
+            return
+
+        if set(warm_start_from.model.TASKS) != set(self.model.TASKS) or set(
+            warm_start_from.sessions
+        ) != set(self.sessions):
+            self.logger.warning(
+                "warm_start_from has a different task structure; solving cold."
+            )
+            return
+
+        try:
+            solver.set_instance(self.model)
+            solver._solver_model.setBasis(basis)
+        except AttributeError:
+            self.logger.warning(
+                "Solver does not support basis warm starts; solving cold."
+            )
+
+    def _extract_basis(self, solver):
+        """Returns the solver's final basis, or None if the interface has none."""
+        try:
+            return solver._solver_model.getBasis()
+        except AttributeError:
+            return None
 
     def _configure_logger(self):
         self.logger = logging.getLogger(__name__)
@@ -334,19 +559,40 @@ class Scheduler:
 
     def _print_solver_output(self):
         """Prints out the results of the solver."""
-        all_cases = self.model.CASES.value_list
-        cases_assigned = []
-        for case, session in self.model.SESSION_ASSIGNED:
-            if self.model.SESSION_ASSIGNED[case, session]() == 1:
-                cases_assigned.append(case)
+        all_cases = [self._case_names[case] for case in self.model.CASES.ordered_data()]
+
+        # One bulk get_values() call instead of resolving each variable value
+        # through Pyomo's expression machinery; > 0.5 guards against solver
+        # tolerances on the binary values.
+        assigned_values = self.model.SESSION_ASSIGNED.get_values()
+        cases_assigned = list(
+            {
+                self._case_names[case]
+                for (case, _), v in assigned_values.items()
+                if v and v > 0.5
+            }
+        )
 
         cases_missed = list(set(all_cases).difference(cases_assigned))
 
         print(f"Num. cases assigned: {len(cases_assigned)} of {len(all_cases)}")
-        print(f"Num. cases assigned: {len(cases_missed)} of {len(all_cases)}")
+        print(f"Num. cases missed: {len(cases_missed)} of {len(all_cases)}")
         print("Cases assigned: ", cases_assigned)
         print("Cases missed: ", cases_missed)
         print(
             "Total objective:"
             f" {sum(self.model.STUDENTS_IN_SESSION.get_values().values())}"
         )
+
+
+def _solve_scenario(scenario: dict) -> pd.DataFrame:
+    """
+    Worker for Scheduler.solve_many: builds a Scheduler from the scenario's
+    constructor arguments and solves it without writing result files. Solver
+    threads are capped at 1, since scenarios already run one per process.
+    """
+    scenario = dict(scenario)
+    options = dict(scenario.pop("options", None) or {})
+    options["threads"] = 1
+
+    return Scheduler(**scenario).solve(options=options, save_results=False)
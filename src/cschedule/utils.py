@@ -1,13 +1,19 @@
+import datetime
 from enum import Enum
+from functools import lru_cache
 
+import numpy as np
 from pandas import to_timedelta
 
 __all__ = [
     "time_to_mins",
     "day_and_time_to_mins",
+    "days_and_times_to_mins",
     "is_within_window",
     "is_overlapping",
+    "overlap_matrix",
     "mins_to_day_and_time",
+    "mins_to_days_and_times",
 ]
 
 
@@ -23,18 +29,39 @@ class Day(Enum):
     SAT = 6
 
 
-def time_to_mins(time: str):
-    """Converts a time (e.g. 9:30 AM) to minutes since midnight."""
-    return to_timedelta(time).total_seconds() / 60
+def time_to_mins(time: str | datetime.time):
+    """
+    Converts a time (e.g. "09:30:00" or datetime.time(9, 30)) to minutes since
+    midnight. A direct integer parse: pandas' to_timedelta allocates a Timedelta
+    and runs a far more general string parser than "HH:MM[:SS]" needs, which adds
+    up when called once per spreadsheet cell.
+    """
+    if isinstance(time, datetime.time):
+        return time.hour * 60 + time.minute + time.second / 60
+
+    parts = str(time).split(":")
+    seconds = int(parts[2]) if len(parts) > 2 else 0
+    return int(parts[0]) * 60 + int(parts[1]) + seconds / 60
 
 
+@lru_cache(maxsize=None)
 def day_and_time_to_mins(day: int, time: str):
     """
     Converts a day and time (e.g. Tue, 9:30 AM) to minutes since Monday 12:00 AM.
+    Cached: the same (day, time) pairs recur across many students, so each unique
+    pair is only parsed once per process.
     """
     return (day - 1) * 1440 + time_to_mins(time)
 
 
+def days_and_times_to_mins(days, times):
+    """
+    Vectorized version of day_and_time_to_mins: converts aligned pandas Series of days
+    and times to minutes since Monday 12:00 AM in one pass.
+    """
+    return (days - 1) * 1440 + to_timedelta(times.astype(str)).dt.total_seconds() / 60
+
+
 def is_within_window(test_window: tuple, other_window: tuple):
     """
     Returns true if test_window is within other_window. Windows should be provided as
@@ -51,6 +78,16 @@ def is_overlapping(test_window: tuple, other_window: tuple):
     return test_window[0] <= other_window[1] and test_window[1] >= other_window[0]
 
 
+def overlap_matrix(windows):
+    """
+    Vectorized version of is_overlapping: given an (N, 2) array of windows, returns an
+    (N, N) boolean matrix whose (i, j) entry is True if windows i and j overlap. One
+    numpy broadcast replaces N^2 Python-level calls to is_overlapping.
+    """
+    starts, ends = windows[:, 0], windows[:, 1]
+    return (starts[:, None] <= ends[None, :]) & (starts[None, :] <= ends[:, None])
+
+
 def mins_to_day_and_time(mins):
     """
     Converts minutes since Monday 12:00 AM to a day and time (Tue, 9:30).
@@ -62,3 +99,20 @@ def mins_to_day_and_time(mins):
     minutes = mins - days * 1440 - hours * 60
 
     return Day(days + 1).name, f"{int(hours):02d}:{int(minutes):02d}"
+
+
+def mins_to_days_and_times(mins):
+    """
+    Vectorized version of mins_to_day_and_time: converts an array of minutes since
+    Monday 12:00 AM to a list of day names and a list of "HH:MM" strings.
+    """
+    mins = np.asarray(mins, dtype=int)
+    days = mins // 1440
+
+    hours = (mins - days * 1440) // 60
+    minutes = mins - days * 1440 - hours * 60
+
+    day_names = np.array([day.name for day in Day])[days + 1]
+    times = [f"{h:02d}:{m:02d}" for h, m in zip(hours, minutes)]
+
+    return day_names.tolist(), times